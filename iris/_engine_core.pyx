@@ -0,0 +1,39 @@
+# cython: language_level=3
+"""
+    Optional compiled core for the SequentialUDPEngine main loop.
+
+    CONCEPT:
+    - the dispatch loop `while run_flag: send_batch(); recv_batch()` is
+    pure interpreter overhead once the batch methods themselves are
+    syscall-bound - every iteration pays bytecode dispatch for the loop
+    head and two calls
+    - compiled with Cython, the loop head and the flag check become plain
+    C, and the two batch callables are invoked through cached object
+    pointers
+
+    NOTE - this extension is optional. The engine falls back to the
+    Python-level loop when it has not been built (there is no build step
+    in this tree; compile it manually with cythonize when wanted).
+"""
+
+
+cdef class EngineCore:
+    """ Holds the two batch callables of an engine and drives them in a
+        C-level loop until the engine's run flag is cleared """
+
+    cdef object _send_batch
+    cdef object _recv_batch
+
+    def __init__(self, send_batch, recv_batch):
+        self._send_batch = send_batch
+        self._recv_batch = recv_batch
+
+    cpdef run(self, object engine):
+        """ Loops send/recv batches while engine._run_flag holds. The flag
+            is re-read through the engine each pass, since stop() rebinds
+            it from another thread """
+        cdef object send_batch = self._send_batch
+        cdef object recv_batch = self._recv_batch
+        while engine._run_flag:
+            send_batch()
+            recv_batch()
@@ -61,6 +61,12 @@ class EngineStopError(EngineError):
 class EngineFlagError(EngineError):
     pass
 
+class EngineSendError(EngineError):
+    pass
+
+class EngineShutdownError(EngineError):
+    pass
+
 
 class TranslatorError(Exception):
     pass
@@ -70,3 +76,24 @@ class TranslatorRegError(TranslatorError):
 
 class TranslatorDeregError(TranslatorError):
     pass
+
+class TranslatorInterfaceError(TranslatorError):
+    pass
+
+class TranslatorOperationError(TranslatorError):
+    pass
+
+class TranslatorOperationKeyError(TranslatorError):
+    pass
+
+class OperationAddError(TranslatorRegError):
+    pass
+
+class TranslatorStartError(TranslatorError):
+    pass
+
+class TranslatorRunError(TranslatorError):
+    pass
+
+class TranslatorStopError(TranslatorError):
+    pass
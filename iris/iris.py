@@ -25,15 +25,13 @@
 """
 
 import socket
-import time
 import threading
 
-from iris.message_queue import MessageQueue
-from iris.message import Message
-from iris.translator import Translator
-from iris.engine import Engine
+from iris.lockfree import SPSCRing
+from iris.message import BinaryMessage, Message
+from iris.engine import SequentialUDPEngine
 from iris.errors import (IrisBindingError, IrisSendingError, MessageInitError,
-                         IrisError)
+                         MessageEncodingError, MessageDecodingError, IrisError)
 from iris import utils
 
 class Iris:
@@ -59,29 +57,39 @@ class Iris:
 
     def _initialize_message_queues(self):
         """ Sets four default message queues, pairs of incoming and outgoing,
-            encoded and plain-text """
-        self._inc_mq = MessageQueue()
-        self._inc_mq_b = MessageQueue()
-        self._out_mq = MessageQueue()
-        self._out_mq_b = MessageQueue()
-
-    def _initialize_endpoints():
+            encoded and plain-text.
+
+            There are only two queues left - messages cross them already
+            as wire-ready BinaryMessages, encoded by the caller of
+            send_message and decoded by the caller of receive_message, so
+            the encoded queue pair and its two extra lock-and-wakeup hops
+            per message are gone. Each remaining queue has exactly one
+            producer and one consumer, so lock-free SPSC rings are used """
+        self._inc_mq = SPSCRing(8192, msg_class=BinaryMessage)
+        self._out_mq = SPSCRing(8192, msg_class=BinaryMessage)
+
+    def _initialize_endpoints(self):
         """ Sets one UDP socket """
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
     def _set_engine(self):
         """ Sets the desired Engine which will perform the operations of
-            sending and receiving messages over the endpoint that we set """
-        self.engine = Engine(endpoint=self._socket, inc_queue=self._inc_mq_b,
-                             out_queue=self._out_mq_b)
+            sending and receiving messages over the endpoint that we set.
+
+            The engine works directly on the two rings - messages in the
+            outgoing ring are encoded before they are pushed and messages
+            in the incoming ring are decoded after they are popped, so the
+            engine loop never touches a codec """
+        self.engine = SequentialUDPEngine(listen_endp=self._socket,
+                                          inc_dest=self._inc_mq,
+                                          out_source=self._out_mq)
 
     def _set_translator(self):
-        """ Sets basic translator and registers the basic queues """
-        self.translator = Translator()
-        self.translator.register_translation(self._out_mq, self.out_mq_b,
-                                             Translator.ENCODING, "Encoding")
-        self.translator.register_translation(self._inc_mq_b, self._inc_mq,
-                                             Translator.DECODING, "Decoding")
+        """ Encoding happens on the producer side in send_message and
+            decoding on the consumer side in receive_message, so there is
+            no translator thread to set up. Kept as an extension hook for
+            implementations that still want a standalone Translator """
+        self.translator = None
 
 
     # API methods
@@ -94,18 +102,24 @@ class Iris:
             from utils module.
 
             Iris attempts to create the Message instance from the payload,
-            and add it to the outgoing MessageQueue """
+            encodes it on the spot and adds it to the outgoing queue. The
+            caller's thread pays the (cheap) encoding cost, which keeps
+            the codec entirely out of the engine loop - no translator
+            thread, no encoded queue hop, no scheduler wakeup """
         if not utils.is_valid_address(host, port):
             raise IrisSendingError("Given invalid address - host: %s"
                                    " port: %d" % (host, port))
         try:
             # TODO - add Message Class as attribute - maybe register it
-            msg = Message(payload, host, port)
-        except MessageInitError as e:
+            if isinstance(payload, bytes):
+                msg = BinaryMessage(payload, host, port)
+            else:
+                msg = Message(payload, host, port).to_binary()
+        except (MessageInitError, MessageEncodingError) as e:
             raise IrisSendingError("Failed to create message with "
                                    "payload: %s" % payload) from e
         else:
-            self._inc_mq.add_message(msg)
+            self._out_mq.add_message(msg)
 
     def receive_message(self):
         """ Client usees this method of Iris to receive incoming messages
@@ -120,6 +134,13 @@ class Iris:
         # For now - only non-blocking version which returns None
         msg = self._inc_mq.get_message()
         if msg:
+            # Decoding is lazy - it happens here, on the consumer's
+            # thread, only for messages that are actually picked up
+            if isinstance(msg, BinaryMessage):
+                try:
+                    msg = msg.from_binary()
+                except MessageDecodingError as e:
+                    return None # TODO - log here
             msg = msg.payload, msg.address[0], msg.address[1]
         return msg
 
@@ -131,7 +152,7 @@ class Iris:
             NOTE - right now can only be set once. """
         if not self.mode == self.UNBOUND:
             raise IrisBindingError("Can bind only when mode is UNBOUND")
-        if not is_valid_address(interface, port):
+        if not utils.is_valid_address(interface, port):
             raise IrisBindingError("Address not valid - interface: %s"
                                    " port: %d" % (interface, port))
         addr = interface, port
@@ -148,32 +169,32 @@ class Iris:
             raise IrisError("Cannot start from the current status")
         self.status = self.RUNNING
         self._run_flag = True
-        self.engine.start()
-        self.translator.start()
+        self._stop_event = threading.Event()
+        self._stopped_event = threading.Event()
+        # Engine start blocks in its run loop, so it gets its own thread
+        engine_thread = threading.Thread(target=self.engine.start,
+                                         name='Iris-Engine')
+        engine_thread.start()
         run_thread = threading.Thread(target=self._run, name='Iris-Run')
         run_thread.start()
 
     def _run(self):
-        """ Basic sequential implementation. While status is 'RUNNING', it
-            loops and calls the appropriate methods """
+        """ Basic sequential implementation. Blocks on the stop event until
+            stop is invoked - the thread idles instead of sleep-polling """
         if not self._run_flag:
             raise IrisError("Can not start running if flag is not set")
-        while self._run_flag:
-            time.sleep(0.001)
-        else:
-            self.status = self.STOPPED
+        self._stop_event.wait()
+        self.status = self.STOPPED
+        self._stopped_event.set()
 
     def stop(self):
         """ Stops everything, can only be called while status is 'RUNNING' """
         if not self.status == self.RUNNING:
             raise IrisError("Cannto stop if status is not RUNNING")
         self.engine.stop()
-        while not self.engine.status == Engine.STOPPED:
-            time.sleep(0.001)
-        self.translator.stop()
-        while not self.translator.status == Translator.STOPPED:
-            time.sleep(0.001)
         self._run_flag = False
+        self._stop_event.set()
+        self._stopped_event.wait()
 
     def shutdown(self):
         """ One of the interface methods, reclaims resources """
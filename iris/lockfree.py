@@ -0,0 +1,99 @@
+"""
+    This module contains lock-free queue implementations used to hand
+    messages between the stages of the Iris pipeline.
+
+    CONCEPT:
+    - every queue in the default Iris wiring has exactly one producer and
+    exactly one consumer (client, engine or translator), so the general
+    lock-protected MessageQueue pays for safety it does not need
+    - a bounded single-producer/single-consumer ring needs no lock at all:
+    the producer only ever advances the tail index and the consumer only
+    ever advances the head index, and under CPython's GIL each individual
+    index load/store is atomic
+    - capacity is a power of two so slot indices are computed with a mask
+    instead of a modulo
+
+    INTERFACE:
+    - try_push(message)/try_pop() - nonblocking, return False/None when
+    the ring is full/empty
+    - add_message(message)/get_message() - MessageQueue-compatible so a
+    ring can be plugged in wherever a MessageQueue is expected
+"""
+
+from iris.errors import MessageQueueError, MessageQueueInitError
+from iris.message import Message
+
+
+class SPSCRing:
+    """ Bounded lock-free single-producer/single-consumer ring buffer.
+
+        NOTE - safe for exactly one producer thread and one consumer
+        thread. With more than one of either, use a locked queue. """
+
+    def __init__(self, capacity=8192, msg_class=Message,
+                 fixed_destination=None):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise MessageQueueInitError("capacity must be a power of two, "
+                                        f"not: {capacity}")
+        self._mask = capacity - 1
+        self._slots = [None] * capacity
+        self._head = 0  # next slot to pop, written only by the consumer
+        self._tail = 0  # next slot to push, written only by the producer
+        # Error text is built once here, not on every full-ring push
+        self._err_full = f"Ring is full, capacity: {capacity}"
+        self.msg_class = msg_class
+        # Optional (host, port) promise that every message in this ring
+        # goes to the same place - engines specialize their send path on it
+        self.fixed_destination = fixed_destination
+
+    # Interface methods
+    def try_push(self, message):
+        """ Adds the message to the ring, returns False when full """
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+        self._slots[tail & self._mask] = message
+        self._tail = tail + 1
+        return True
+
+    def try_pop(self):
+        """ Returns the oldest message in the ring, or None when empty """
+        head = self._head
+        if head == self._tail:
+            return None
+        slot = head & self._mask
+        message = self._slots[slot]
+        self._slots[slot] = None
+        self._head = head + 1
+        return message
+
+    # MessageQueue-compatible interface
+    def add_message(self, message):
+        """ Same as try_push, but raises when the ring is full so it can
+            stand in for a MessageQueue """
+        if not self.try_push(message):
+            raise MessageQueueError(self._err_full)
+
+    def get_message(self):
+        return self.try_pop()
+
+    def get_messages(self, max_n):
+        """ Pops up to max_n messages in one call, list is empty when the
+            ring is """
+        messages = []
+        while len(messages) < max_n:
+            message = self.try_pop()
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
+    def add_messages(self, messages):
+        """ Pushes a whole list of messages, raises when the ring fills up
+            midway """
+        for message in messages:
+            if not self.try_push(message):
+                raise MessageQueueError(self._err_full)
+
+    def __len__(self):
+        return self._tail - self._head
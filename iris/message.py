@@ -4,9 +4,11 @@
     CONCEPT:
     - Message classes represent the actual types of messages that are being
     transferred over the network by Iris
-    - each Message class has two modes - binary and nonbinary
-    - each Message class has two posses two methods that will enable the
-    encoding and decoding from these two modes
+    - the encoding state of a message is its type: TextMessage carries a
+    str payload, BinaryMessage carries bytes ready for the wire
+    - to_binary/from_binary convert between the two types, so misuse
+    (encoding twice, decoding text) is impossible by construction and no
+    per-call mode check is paid
     - Message classes have defined maximum sizes of messages
 
     FUTURE:
@@ -19,98 +21,161 @@ from iris.errors import (MessageInitError, MessageEncodingError,
                          MessageDecodingError)
 from iris import utils
 
+try:
+    # Optional compiled codec - direct PyUnicode C API calls instead of
+    # method dispatch plus codec registry lookup per payload
+    from iris._message_codec import (encode_payload, decode_payload,
+                                     decode_payload_fast, to_binary_batch)
+except ImportError:
+    def encode_payload(payload):
+        # isascii is a single C-level flag check, and the ascii codec
+        # skips the UTF-8 machinery for the common all-ASCII payload
+        if payload.isascii():
+            return payload.encode('ascii')
+        return payload.encode('UTF-8')
+
+    def decode_payload(payload):
+        return payload.decode('UTF-8')
+
+    def decode_payload_fast(buf):
+        # Without the compiled codec the intermediate bytes copy cannot
+        # be avoided for non-bytes buffers
+        return bytes(buf).decode('UTF-8')
+
+    def to_binary_batch(messages):
+        """ Encodes a burst of messages in one pass, returning the list
+            of wire-ready messages. The compiled codec runs this as a
+            single C loop; here the loop at least skips messages that
+            are already binary """
+        return [message if isinstance(message, BinaryMessage)
+                else message.to_binary()
+                for message in messages]
+
+# Marks the encoder as batch-aware - Translator hands such an operation
+# the whole burst in one call instead of mapping it message by message
+try:
+    to_binary_batch.batch_aware = True
+except AttributeError:
+    # The compiled codec function may not take new attributes - rebind it
+    # through a thin wrapper that does, the per-burst call is negligible
+    _codec_to_binary_batch = to_binary_batch
+
+    def to_binary_batch(messages):
+        return _codec_to_binary_batch(messages)
+
+    to_binary_batch.batch_aware = True
+
 
 class BaseMessage:
     """ Base class of Message class hierarchy.
 
-        Gives the overall skeleton which has to be inherited. """
+        Gives the overall skeleton which has to be inherited. The
+        payload/address/payload_parts slots are declared here once -
+        thousands of in-flight messages sit in the queues at a time, and
+        slots cut each one from dict-sized to a handful of pointer-sized
+        entries while making every attribute access a fixed offset.
+        payload_parts is the optional scatter/gather form of a binary
+        payload - a tuple of buffer parts (e.g. framing header + body)
+        that engines hand straight to sendmsg, so the kernel gathers
+        them with no user-space header + body concatenation """
 
-    NONBINARY = 0
-    BINARY = 1
+    PAYLOAD_SIZE_BINARY = 1500
 
+    __slots__ = ('payload', 'address', 'payload_parts')
 
-    @staticmethod
-    def to_binary(message):
-        raise NotImplementedError
 
-    @staticmethod
-    def from_binary(message):
-        raise NotImplementedError
+    @classmethod
+    def _from_trusted(cls, payload, host, port):
+        """ Builds a message without any validation, bypassing __init__.
+
+            For addresses that are already trusted - the receive path
+            gets them from the kernel, which will not hand back an
+            invalid peer - so there is no resolver call per received
+            message. User code goes through the validating __init__ """
+        message = cls.__new__(cls)
+        message.payload = payload
+        message.address = host, port
+        message.payload_parts = None
+        return message
 
     def __init__(self, payload, host, port):
         if not utils.is_valid_address(host, port):
-            raise MessageInitError("Invalid address %s:%s was provided"
-                                   % (str(host, str(port))))
+            raise MessageInitError(f"Invalid address {host}:{port} was"
+                                   " provided")
         if not payload:
             raise MessageInitError("Cannot initialize without payload!")
-        if type(payload) == bytes:
-            self._init_binary(payload, host, port)
-        else:
-            self._init_nonbinary(payload, host, port)
+        self._init_payload(payload)
+        self.address = host, port
+        self.payload_parts = None
 
-    def _init_binary(self, payload, host, port):
+    def _init_payload(self, payload):
         raise NotImplementedError
 
-    def _init_nonbinary(self, payload, host, port):
-        raise NotImplementedError
 
+class TextMessage(BaseMessage):
+    """ Message whose payload is a text string, as handed over by the
+        client. Encoding it for the wire produces a BinaryMessage - the
+        encoding state lives in the type, not in a runtime mode tag """
 
-class TextMessage:
-    """ Base class of Message class sub-hierarchy that uses text payload.
+    __slots__ = ()
 
-        Contains basic text strings as payload, with static methods
-        offering basic encoding and decoding of the payload """
 
-    PAYLOAD_SIZE_BINARY = 1500
+    def to_binary(self):
+        """ Responsible for encoding the message payload, in order to get
+            it ready for transmission.
 
+            Returns the wire-ready BinaryMessage """
+        try:
+            # TODO - add encoding as class parameter
+            payload = encode_payload(self.payload)
+        except UnicodeEncodeError as e:
+            raise MessageEncodingError(f"Failed to encode the payload:"
+                                       f" {self.payload}") from e
+        return BinaryMessage._from_trusted(payload, self.address[0],
+                                           self.address[1])
 
-    @staticmethod
-    def to_binary(message):
-        """ Responsible for encoding the message into BINARY mode, from
-            NONBINARY, in order to get it ready for transmission.
-
-            Can only be called with message in NONBINARY mode """
-        if message.mode == Message.NONBINARY:
-            try:
-                # TODO - add encoding as class parameter
-                message.payload = message.payload.encode('UTF-8')
-            except UnicodeEncodeError as e:
-                raise MessageEncodingError("Failed to encode the payload: %s"
-                                           % message.payload) from e
-            else:
-                message.mode = Message.BINARY
-                return message
-        else:
-            raise MessageEncodingError("Message must be in NONBINARY mode")
-
-    @staticmethod
-    def from_binary(message):
-        """ Responsible for decoding the message into NONBINARY mode, from
-            BINARY, in order to get it ready for consumption by client.
-
-            Can only be called with message in BINARY mode """
-        if message.mode == Message.BINARY:
-            try:
-                message.payload = message.payload.decode("UTF-8")
-            except UnicodeDecodeError as e:
-                raise MessageDecodingError("Failed to decode the payload: %s"
-                                           % message.payload) from e
-            else:
-                message.mode = Message.NONBINARY
-                return message
+    def _init_payload(self, payload):
+        if isinstance(payload, str):
+            self.payload = payload
         else:
-            raise MessageDecodingError("Message must be in BINARY mode")
+            raise MessageInitError("TextMessages must have payload of str"
+                                   f" type not: {type(payload)}")
 
-    def _init_binary(self, payload, host, port):
-        self.payload = payload
-        self.address = host, port
-        self.mode = self.BINARY
 
-    def _init_nonbinary(self, payload, host, port):
-        if type(payload) == str:
+class BinaryMessage(BaseMessage):
+    """ Message whose payload is wire-ready bytes, as received off the
+        socket or produced by TextMessage.to_binary """
+
+    __slots__ = ()
+
+
+    def from_binary(self):
+        """ Responsible for decoding the message payload, in order to get
+            it ready for consumption by client.
+
+            Returns the decoded TextMessage """
+        try:
+            payload = self.payload
+            if type(payload) is bytes:
+                payload = decode_payload(payload)
+            else:
+                # Buffer payload (pooled bytearray, memoryview) - decode
+                # straight out of it, no bytes copy first
+                payload = decode_payload_fast(payload)
+        except UnicodeDecodeError as e:
+            raise MessageDecodingError(f"Failed to decode the payload:"
+                                       f" {self.payload}") from e
+        return TextMessage._from_trusted(payload, self.address[0],
+                                         self.address[1])
+
+    def _init_payload(self, payload):
+        if isinstance(payload, (bytes, bytearray, memoryview)):
             self.payload = payload
-            self.address = host, port
-            self.mode = self.NONBINARY
         else:
-            raise MessageInitError("Nonbinary TextMessages must have payload"
-                                   " of str type not: %s" % str(type(payload)))
+            raise MessageInitError("BinaryMessages must have payload of"
+                                   f" bytes type not: {type(payload)}")
+
+
+# Default message class used throughout Iris - text payloads over UDP are
+# what Iris speaks today
+Message = TextMessage
@@ -9,8 +9,17 @@
     - get_message() - returns message instance from the queue
     - add_message(message) - adds the message instance from the queue. Must
     be an instance of Message class set before
+    - get_messages(max_n) - returns a list of up to max_n messages
+    - add_messages(messages) - adds a whole list of messages at once
 """
 
+import queue
+import threading
+from collections import deque
+
+from iris.errors import MessageQueueError, MessageQueueInitError
+from iris.message import BaseMessage, Message
+
 # NOTE - option to add thread-safety via mixins
 
 
@@ -20,12 +29,25 @@ class MessageQueue:
         NOTE - not thread-safe! Should not be used in situations in which
         race conditions may occur. """
 
-    def __init__(self, msg_class=Message):
-        if not issubclass(msg_class, Message):
+    def __init__(self, msg_class=Message, fixed_destination=None):
+        if not issubclass(msg_class, BaseMessage):
             raise MessageQueueInitError("msg_class argument must be a class "
                                         "from Message class hierarchy")
-        self._messages = []
+        # deque, not list - popping the head of a list shifts every
+        # remaining element (O(n) per dequeue, O(n^2) to drain), while
+        # deque.popleft() is O(1)
+        self._messages = deque()
         self.msg_class = msg_class
+        # Exact type for the add_message fast path - one pointer compare
+        # instead of an isinstance MRO walk when producers emit the exact
+        # class, which is the overwhelmingly common case
+        self._exact_type = msg_class
+        # Error text is built once here, not on every failed check
+        self._err_bad_type = (f"Can only add instances of "
+                              f"{msg_class.__name__} class or its subclasses")
+        # Optional (host, port) promise that every message in this queue
+        # goes to the same place - engines specialize their send path on it
+        self.fixed_destination = fixed_destination
 
     # Interface methods
     def get_message(self):
@@ -34,7 +56,7 @@ class MessageQueue:
         if not self._messages:
             return None
         else:
-            return self._messages.pop(0)
+            return self._messages.popleft()
 
     def add_message(self, message):
         """ Attempts to append message to the internal queue.
@@ -42,42 +64,404 @@ class MessageQueue:
             Raises error if message argument is not instance of the message
             class set during initialization """
         # NOTE - maybe check strictly, without allowing subclass' instances
-        if not isinstance(message, self.msg_class):
-            raise MessageQueueError("Can only add instances of %s class or its"
-                                    " subclasses" % (self.msg_class))
+        if not (type(message) is self._exact_type
+                or isinstance(message, self.msg_class)):
+            raise MessageQueueError(self._err_bad_type)
         self._messages.append(message)
 
+    def add_message_unchecked(self, message):
+        """ Appends without the type check. For producers that have been
+            verified once up front to emit this queue's message class -
+            e.g. at operation-registration time - so the per-message check
+            is not paid at all """
+        self._messages.append(message)
+
+    def get_messages(self, max_n):
+        """ Returns a list of up to max_n messages, removing them from the
+            queue. The list is empty when the queue is. Consumers that can
+            process messages in bulk should prefer this over calling
+            get_message once per message """
+        pending = self._messages
+        messages = []
+        while pending and len(messages) < max_n:
+            messages.append(pending.popleft())
+        return messages
+
+    def add_messages(self, messages):
+        """ Appends a whole list of messages to the queue at once.
+
+            Raises error if any of them is not an instance of the message
+            class set during initialization """
+        exact_type = self._exact_type
+        for message in messages:
+            if not (type(message) is exact_type
+                    or isinstance(message, self.msg_class)):
+                raise MessageQueueError(self._err_bad_type)
+        self._messages.extend(messages)
+
     def __len__(self):
         return len(self._messages)
 
 
+class BatchedOutSource:
+    """ Outgoing message store with structure-of-arrays layout.
+
+        Messages are split apart on the way in: payloads and addresses
+        live in two parallel deques instead of one object per message.
+        get_batch(n) hands both out as lists straight to the send path,
+        which is the shape sendmmsg consumes - no per-message
+        .payload/.address attribute chasing while building a batch.
+
+        The object form only exists at the boundaries: get_message
+        reassembles a Message for consumers that need one, keeping the
+        regular source interface intact.
+
+        NOTE - not thread-safe, same as MessageQueue """
+
+    def __init__(self, msg_class=Message, fixed_destination=None):
+        if not issubclass(msg_class, BaseMessage):
+            raise MessageQueueInitError("msg_class argument must be a class "
+                                        "from Message class hierarchy")
+        self._payloads = deque()
+        self._addresses = deque()
+        self.msg_class = msg_class
+        self._err_bad_type = (f"Can only add instances of "
+                              f"{msg_class.__name__} class or its subclasses")
+        self.fixed_destination = fixed_destination
+
+    # Interface methods
+    def add_message(self, message):
+        """ Splits the message into the parallel payload/address lists """
+        if not isinstance(message, self.msg_class):
+            raise MessageQueueError(self._err_bad_type)
+        self._payloads.append(message.payload)
+        self._addresses.append(message.address)
+
+    def add_messages(self, messages):
+        for message in messages:
+            self.add_message(message)
+
+    def get_message(self):
+        """ Reassembles and returns the oldest message, or None. The
+            address was validated when the message came in, so the
+            unvalidated constructor skips the resolver call on the way
+            back out """
+        if not self._payloads:
+            return None
+        payload = self._payloads.popleft()
+        address = self._addresses.popleft()
+        return self.msg_class._from_trusted(payload, address[0],
+                                            address[1])
+
+    def get_batch(self, max_n):
+        """ Returns up to max_n pending datagrams as a (payloads,
+            addresses) pair of parallel lists, removing them from the
+            store. Both lists are empty when nothing is pending """
+        payloads = self._payloads
+        addresses = self._addresses
+        if len(payloads) <= max_n:
+            batch = list(payloads), list(addresses)
+            payloads.clear()
+            addresses.clear()
+            return batch
+        return ([payloads.popleft() for _ in range(max_n)],
+                [addresses.popleft() for _ in range(max_n)])
+
+    def __len__(self):
+        return len(self._payloads)
+
+
+class BulkMessageQueue:
+    """ Message store with structure-of-arrays layout for bulk codec
+        passes.
+
+        Messages are split on the way in: payloads and addresses live in
+        two parallel deques instead of one object per message. A bulk
+        encode pass then runs over the payload list alone in one tight
+        loop - map(str.encode, payloads) or a compiled batch codec -
+        touching one flat sequence instead of chasing attributes through
+        every message object.
+
+        get_message reassembles a Message on demand, keeping the regular
+        queue interface intact at the boundaries.
+
+        NOTE - not thread-safe, same as MessageQueue """
+
+    def __init__(self, msg_class=Message, fixed_destination=None):
+        if not issubclass(msg_class, BaseMessage):
+            raise MessageQueueInitError("msg_class argument must be a class "
+                                        "from Message class hierarchy")
+        self._payloads = deque()
+        self._addrs = deque()
+        self.msg_class = msg_class
+        self._exact_type = msg_class
+        self._err_bad_type = (f"Can only add instances of "
+                              f"{msg_class.__name__} class or its subclasses")
+        self.fixed_destination = fixed_destination
+
+    # Interface methods
+    def add_message(self, message):
+        """ Splits the message into the parallel deques """
+        if not (type(message) is self._exact_type
+                or isinstance(message, self.msg_class)):
+            raise MessageQueueError(self._err_bad_type)
+        self._payloads.append(message.payload)
+        self._addrs.append(message.address)
+
+    def add_messages(self, messages):
+        for message in messages:
+            self.add_message(message)
+
+    def get_message(self):
+        """ Reassembles and returns the oldest message, or None """
+        if not self._payloads:
+            return None
+        payload = self._payloads.popleft()
+        address = self._addrs.popleft()
+        return self.msg_class._from_trusted(payload, address[0],
+                                            address[1])
+
+    def drain_payloads(self):
+        """ Removes and returns everything pending as two parallel lists
+            (payloads, addresses) - the shape a bulk encoder consumes in
+            a single pass. The lists are empty when the store is """
+        payloads = list(self._payloads)
+        addrs = list(self._addrs)
+        self._payloads.clear()
+        self._addrs.clear()
+        return payloads, addrs
+
+    def __len__(self):
+        return len(self._payloads)
+
+
+class RingMessageQueue:
+    """ Bounded multi-producer/multi-consumer ring buffer queue.
+
+        Python adaptation of the scalable circular-queue designs built on
+        atomic fetch-and-add: slots live in a list preallocated to a
+        power-of-two capacity, so positions are computed with a mask
+        instead of a modulo and no node is ever allocated per message.
+        CPython exposes no fetch-and-add, so a lock drives the head/tail
+        indices instead - but it is held only for the index arithmetic
+        and the slot swap, a handful of C-level operations. Message
+        validation happens entirely outside it, so producers and
+        consumers contend for nanoseconds, not for the whole operation
+        the way LockMessageQueue's full-method lock does """
+
+    def __init__(self, capacity=8192, msg_class=Message,
+                 fixed_destination=None):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise MessageQueueInitError("capacity must be a power of two, "
+                                        f"not: {capacity}")
+        if not issubclass(msg_class, BaseMessage):
+            raise MessageQueueInitError("msg_class argument must be a class "
+                                        "from Message class hierarchy")
+        self._slots = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = 0
+        self._lock = threading.Lock()
+        self.msg_class = msg_class
+        self._exact_type = msg_class
+        # Error text is built once here, not on every failed check or
+        # full-ring push
+        self._err_bad_type = (f"Can only add instances of "
+                              f"{msg_class.__name__} class or its subclasses")
+        self._err_full = f"Ring is full, capacity: {capacity}"
+        self.fixed_destination = fixed_destination
+
+    # Interface methods
+    def add_message(self, message):
+        """ Adds the message to the ring, raises when it is full """
+        if not (type(message) is self._exact_type
+                or isinstance(message, self.msg_class)):
+            raise MessageQueueError(self._err_bad_type)
+        with self._lock:
+            tail = self._tail
+            if tail - self._head > self._mask:
+                raise MessageQueueError(self._err_full)
+            self._slots[tail & self._mask] = message
+            self._tail = tail + 1
+
+    def get_message(self):
+        """ Returns the oldest message in the ring, or None when empty """
+        with self._lock:
+            head = self._head
+            if head == self._tail:
+                return None
+            slot = head & self._mask
+            message = self._slots[slot]
+            self._slots[slot] = None
+            self._head = head + 1
+        return message
+
+    def add_messages(self, messages):
+        """ Adds a whole list of messages under one lock acquisition,
+            raises when the ring cannot hold them all """
+        for message in messages:
+            if not isinstance(message, self.msg_class):
+                raise MessageQueueError(self._err_bad_type)
+        with self._lock:
+            tail = self._tail
+            if tail - self._head + len(messages) > self._mask + 1:
+                raise MessageQueueError(self._err_full)
+            slots = self._slots
+            mask = self._mask
+            for message in messages:
+                slots[tail & mask] = message
+                tail += 1
+            self._tail = tail
+
+    def get_messages(self, max_n):
+        """ Pops up to max_n messages under one lock acquisition, the
+            list is empty when the ring is """
+        messages = []
+        with self._lock:
+            head = self._head
+            tail = self._tail
+            slots = self._slots
+            mask = self._mask
+            while head != tail and len(messages) < max_n:
+                slot = head & mask
+                messages.append(slots[slot])
+                slots[slot] = None
+                head += 1
+            self._head = head
+        return messages
+
+    def __len__(self):
+        return self._tail - self._head
+
+
 class LockMessageQueue(MessageQueue):
     """ Subclass of MessageQueue which provides thread-safe access for usage
         in concurrent applications.
 
-        Owns its private lock which is used during adding and removing messages
-        from internal message list """
+        The single-message operations carry no lock at all: on CPython a
+        deque append or popleft is one atomic C-level operation under the
+        GIL, so wrapping it in a lock only pays an acquire/release pair
+        per message for no semantic benefit. Correctness of those paths
+        therefore depends on the GIL - they are not safe on a runtime
+        without it. The lock remains for the genuinely composite batch
+        operations, where several deque operations must be linearizable
+        as a unit """
 
-    def __init__(self, msg_class=Message):
-        super().__init__(msg_class)
+    def __init__(self, msg_class=Message, fixed_destination=None):
+        super().__init__(msg_class, fixed_destination)
         self._lock = threading.Lock()
 
     # Interface methods
     def get_message(self):
-        """ Retrieves the message using the internal threading.Lock object,
-            therefore ensuring thread-safety! """
-        with self._lock:
-            if not self._messages:
-                return None
-            else:
-                return self._messages.pop(0)
+        """ Pops the oldest message, or returns None when empty.
+
+            EAFP - popleft either succeeds atomically or raises, so there
+            is no emptiness check to race against and no lock needed """
+        try:
+            return self._messages.popleft()
+        except IndexError:
+            return None
 
     def add_message(self, message):
-        """ Adds the message instance using the internal threading.Lock object.
+        """ Adds the message instance with a single lock-free atomic
+            append.
 
             If message is not instance of set message class, raises error """
-        if not isinstance(message, self.msg_class):
-            raise MessageQueueError("Can only add instances of %s"
-                                    % self.msg_class)
+        if not (type(message) is self._exact_type
+                or isinstance(message, self.msg_class)):
+            raise MessageQueueError(self._err_bad_type)
+        self._messages.append(message)
+
+    def get_messages(self, max_n):
+        """ Batched retrieval under a single lock acquisition - the lock
+            cost is amortized over the whole batch.
+
+            The lock only excludes other batch operations - the lock-free
+            get_message can still pop concurrently, so the emptiness
+            check cannot be trusted between iterations. EAFP like
+            get_message: popleft either succeeds atomically or raises """
+        messages = []
+        with self._lock:
+            popleft = self._messages.popleft
+            try:
+                while len(messages) < max_n:
+                    messages.append(popleft())
+            except IndexError:
+                pass
+        return messages
+
+    def add_messages(self, messages):
+        """ Batched adding under a single lock acquisition """
+        for message in messages:
+            if not isinstance(message, self.msg_class):
+                raise MessageQueueError(self._err_bad_type)
         with self._lock:
-            self._messages.append(message)
+            self._messages.extend(messages)
+
+
+class SimpleMessageQueue:
+    """ Thread-safe queue backed by queue.SimpleQueue.
+
+        SimpleQueue lives in C (CPython's _queue module), so the whole
+        put/get path - lock, wakeup, deque - runs without a Python frame
+        per operation. For the common one-producer/one-consumer stage it
+        is several times faster than the Python-level LockMessageQueue.
+
+        The per-message type check is off by default to keep the hot
+        path in C end to end; pass check_types=True to re-enable it
+        while debugging a pipeline """
+
+    def __init__(self, msg_class=Message, fixed_destination=None,
+                 check_types=False):
+        if not issubclass(msg_class, BaseMessage):
+            raise MessageQueueInitError("msg_class argument must be a class "
+                                        "from Message class hierarchy")
+        self._q = queue.SimpleQueue()
+        self.msg_class = msg_class
+        self._exact_type = msg_class
+        self._check_types = check_types
+        self._err_bad_type = (f"Can only add instances of "
+                              f"{msg_class.__name__} class or its subclasses")
+        self.fixed_destination = fixed_destination
+
+    # Interface methods
+    def add_message(self, message):
+        """ Adds the message, type-checked only in debug mode """
+        if self._check_types and not (type(message) is self._exact_type
+                                      or isinstance(message, self.msg_class)):
+            raise MessageQueueError(self._err_bad_type)
+        self._q.put(message)
+
+    def get_message(self):
+        """ Returns the oldest message, or None when empty """
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            return None
+
+    def add_messages(self, messages):
+        """ Adds a whole list of messages """
+        if self._check_types:
+            exact_type = self._exact_type
+            for message in messages:
+                if not (type(message) is exact_type
+                        or isinstance(message, self.msg_class)):
+                    raise MessageQueueError(self._err_bad_type)
+        put = self._q.put
+        for message in messages:
+            put(message)
+
+    def get_messages(self, max_n):
+        """ Returns a list of up to max_n messages, empty when the queue
+            is """
+        get_nowait = self._q.get_nowait
+        messages = []
+        try:
+            while len(messages) < max_n:
+                messages.append(get_nowait())
+        except queue.Empty:
+            pass
+        return messages
+
+    def __len__(self):
+        return self._q.qsize()
@@ -22,11 +22,156 @@
     * stop - stops everything
 """
 
+import asyncio
+import struct
 import threading
+import zlib
+from typing import Callable, NamedTuple, Optional
 
 from iris.errors import (TranslatorError, TranslatorRegError,
                          MessageDecodingError, TranslatorDeregError,
-                         MessageEncodingError)
+                         MessageEncodingError, MessageError,
+                         TranslatorStartError, TranslatorRunError,
+                         TranslatorStopError, TranslatorInterfaceError,
+                         TranslatorOperationError,
+                         TranslatorOperationKeyError, OperationAddError)
+
+try:
+    # Optional compiled checksum (SIMD carry-less multiply CRC). Without
+    # it, zlib's C implementation is used - still far faster than any
+    # Python-level loop, and it releases the GIL for larger buffers
+    from iris._crc import crc32 as _crc32
+except ImportError:
+    _crc32 = zlib.crc32
+
+_FRAME_HEADER = struct.Struct("!I")
+
+
+def frame_payload(payload):
+    """ Builds an integrity frame around a binary payload.
+
+        Returns a (header, payload) tuple of parts where the header
+        carries the payload's CRC32 - the exact shape Message
+        payload_parts expects, so the engine can send it scatter/gather
+        without ever concatenating header and body """
+    return (_FRAME_HEADER.pack(_crc32(payload)), payload)
+
+
+def unframe_payload(data):
+    """ Splits a framed datagram back into its payload, verifying the
+        CRC32 carried in the header.
+
+        Raises MessageDecodingError when the datagram is too short or the
+        checksum does not match """
+    if len(data) < _FRAME_HEADER.size:
+        raise MessageDecodingError("Framed datagram too short: %d bytes"
+                                   % len(data))
+    expected, = _FRAME_HEADER.unpack_from(data)
+    payload = data[_FRAME_HEADER.size:]
+    if _crc32(payload) != expected:
+        raise MessageDecodingError("Checksum mismatch on framed datagram")
+    return payload
+
+
+class InlineEncodingSource:
+    """ Source adapter that fuses encoding into the engine's send path.
+
+        Wraps a plain-text message source: get_message pulls from it and
+        encodes on the spot, inside the engine's own loop. The encoded
+        queue hop - and the translator thread that fed it - disappears,
+        which removes one lock pair and one thread wakeup per message """
+
+    def __init__(self, source, encode):
+        self._source = source
+        self._encode = encode
+        self.msg_class = getattr(source, 'msg_class', None)
+
+    def get_message(self):
+        message = self._source.get_message()
+        if message is None:
+            return None
+        try:
+            return self._encode(message)
+        except MessageEncodingError as e:
+            return None # TODO - log here
+
+    def get_messages(self, max_n):
+        get_batch = getattr(self._source, 'get_messages', None)
+        if get_batch is not None:
+            messages = get_batch(max_n)
+        else:
+            messages = []
+            while len(messages) < max_n:
+                message = self._source.get_message()
+                if message is None:
+                    break
+                messages.append(message)
+        encode = self._encode
+        encoded = []
+        for message in messages:
+            try:
+                encoded.append(encode(message))
+            except MessageEncodingError as e:
+                pass # TODO - log here
+        return encoded
+
+
+class InlineDecodingDest:
+    """ Destination adapter that fuses decoding into the engine's receive
+        path.
+
+        Every message the engine adds is decoded on the spot and handed
+        straight to the wrapped plain-text destination - the binary
+        incoming queue and the translator hop over it disappear """
+
+    def __init__(self, dest, decode):
+        self._dest = dest
+        self._decode = decode
+        self.msg_class = getattr(dest, 'msg_class', None)
+
+    def add_message(self, message):
+        try:
+            message = self._decode(message)
+        except MessageDecodingError as e:
+            pass # TODO - log here
+        else:
+            self._dest.add_message(message)
+
+    def add_messages(self, messages):
+        decode = self._decode
+        decoded = []
+        for message in messages:
+            try:
+                decoded.append(decode(message))
+            except MessageDecodingError as e:
+                pass # TODO - log here
+        if not decoded:
+            return
+        add_batch = getattr(self._dest, 'add_messages', None)
+        if add_batch is not None:
+            add_batch(decoded)
+        else:
+            for message in decoded:
+                self._dest.add_message(message)
+
+
+class Op(NamedTuple):
+    """ One registered operation, prebound for the run loop.
+
+        get and put are the *bound methods* of the source and
+        destination queues, captured at registration time - each
+        invocation in the loop is then a direct call with no attribute
+        resolution. get_many/put_many are the optional batch forms, None
+        when the queue does not offer them. batched records whether fn
+        itself consumes a whole message list (fn.batch_aware), looked up
+        once here instead of per pass """
+
+    get: Callable
+    fn: Callable
+    put: Callable
+    get_many: Optional[Callable]
+    put_many: Optional[Callable]
+    batched: bool
 
 
 class Translator:
@@ -36,20 +181,32 @@ class Translator:
     RUNNING = 11
     STOPPED = 12
 
+    # How many messages one pass moves per operation when both queues
+    # support the batch interface - one lock acquisition per side covers
+    # the whole burst
+    BATCH = 64
+
 
     def __init__(self):
         self.operations = {}
+        # The run loop iterates this plain list of bound-method tuples,
+        # kept in sync eagerly at (de)registration time - a list iterator
+        # advances a pointer, where iterating the dict walks a hash table
+        # and version checks cost a compare per pass
+        self._op_list = []
+        # Set by the run loop on exit so stop can park on it instead of
+        # sleep-polling the status
+        self._stopped_evt = threading.Event()
         self.status = self.CREATED
 
     def register_operation(self, input, output, operation, op_key):
         """ Input and output are required to satisfy the desired interface,
             and must have their Message class attributes set as equal. """
         try:
-            self._check_interface(input, attr="get_message")
-            self._check_interface(output, attr="add_message")
-            self._check_interface(operation, type_is=function)
+            self._check_endpoints(input, output)
+            self._check_operation(operation)
             self._check_operation_key(op_key)
-        except TranslatorInputError, TranslatorOutputError as e:
+        except TranslatorInterfaceError as e:
             raise TranslatorRegError("Failed to register translation") from e
         except TranslatorOperationError as e:
             raise TranslatorRegError("Failed to register translation with"
@@ -60,6 +217,12 @@ class Translator:
         else:
             self._add_operation(input, output, operation, op_key)
 
+    def _check_endpoints(self, input, output):
+        """ Hook for the endpoint interface checks - subclasses accepting
+            other endpoint shapes override this """
+        self._check_interface(input, attr="get_message")
+        self._check_interface(output, attr="add_message")
+
     def _check_interface(self, object, attr=None, type_is=None):
         if attr:
             if not hasattr(object, attr):
@@ -70,58 +233,218 @@ class Translator:
                 raise TranslatorInterfaceError("Object must be of type %s "
                                                "for translator" % str(type_is))
 
+    def _check_operation(self, operation):
+        if not callable(operation):
+            raise TranslatorOperationError("Operation must be callable, "
+                                           "got: %s" % str(type(operation)))
+
     def _check_operation_key(self, op_key):
         if not hasattr(op_key, "__hash__"):
-            raise OperationKeyError("OpKey must provide `__hash__` method")
+            raise TranslatorOperationKeyError("OpKey must provide `__hash__`"
+                                              " method")
         if not hasattr(op_key, "__eq__"):
-            raise OperationKeyError("OpKey must provide '__eq__' method")
+            raise TranslatorOperationKeyError("OpKey must provide '__eq__'"
+                                              " method")
 
     def _add_operation(self, input, output, operation, op_key):
         if not op_key in self.operations:
             self.operations[op_key] = (input, output, operation)
+            self._rebuild_op_list()
         else:
             raise OperationAddError("Operation %s already registerd under the"
                                     " same key" % str(self.operations[op_key]))
 
     def deregister_operation(self, op_key):
-        if op_name in self.operations:
-            self.operations.pop(op_name)
+        if op_key in self.operations:
+            self.operations.pop(op_key)
+            self._rebuild_op_list()
         else:
             raise TranslatorDeregError("Operation Key %s not registered"
                                        % str(op_key))
 
+    def _rebuild_op_list(self):
+        """ Rebuilds the run loop's operation list from the registration
+            dict. Registration order is preserved, so iteration order is
+            deterministic. The list is replaced, never mutated in place -
+            a running loop finishes its pass over the old snapshot and
+            picks the new one up on the next """
+        # getattr with a None default - AsyncTranslator also registers
+        # get/put endpoints, which its own run loop binds in _pump
+        self._op_list = [Op(getattr(src, 'get_message', None), operation,
+                            getattr(dest, 'add_message', None),
+                            getattr(src, 'get_messages', None),
+                            getattr(dest, 'add_messages', None),
+                            getattr(operation, 'batch_aware', False))
+                         for src, dest, operation
+                         in self.operations.values()]
+
     def start(self):
         """ Responsible for starting internal _run() that runs in a single
             thread, setting the running flag before it to True """
         if self.status in (self.CREATED, self.STOPPED):
             self._run_flag = True
+            self._stopped_evt.clear()
             self._run()
         else:
             raise TranslatorStartError("Start must be called from CREATED or "
                                       "STOPPED status!")
 
     def _run(self):
-        """ Sequentially loops over the registered actions and invokes them """
+        """ Sequentially loops over the registered actions and invokes them.
+
+            The loop works off the prebuilt operation list instead of
+            indexing the operations dict - that costs three dict lookups
+            and three attribute lookups per message, which adds up over
+            millions of them. The list is maintained eagerly at
+            (de)registration time, so the loop itself does not even pay a
+            staleness check; it just re-reads the list attribute once per
+            outer pass to pick up replacements.
+
+            When both sides of an operation support the batch interface,
+            up to BATCH messages are moved per pass - the queue locks are
+            taken once per burst instead of once per message. Operations
+            marked batch_aware (to_binary_batch and kin) get the whole
+            list to chew through in one call; the rest are mapped over
+            it message by message """
         if self._run_flag:
             self.status = self.RUNNING
-            while self._run_flag:
-                for op in self.operations:
-                    try:
-                        message = self.operations[op][0].get_message()
-                        message_processed = self.operations[op][2]()
-                        self.operations[op][1].add_message(message_processed)
-                    except MessageError as e:
-                        raise e # TODO
-            else:
+            batch = self.BATCH
+            try:
+                while self._run_flag:
+                    for get, fn, put, get_many, put_many, batched \
+                            in self._op_list:
+                        try:
+                            if get_many is not None and put_many is not None:
+                                messages = get_many(batch)
+                                if not messages:
+                                    continue
+                                if batched:
+                                    put_many(fn(messages))
+                                else:
+                                    put_many([fn(message)
+                                              for message in messages])
+                            else:
+                                message = get()
+                                if message is None:
+                                    continue
+                                if batched:
+                                    put(fn([message])[0])
+                                else:
+                                    put(fn(message))
+                        except MessageError as e:
+                            raise e # TODO
+            finally:
+                # Always acknowledge, even when the loop dies on an
+                # exception - stop() blocks on the stopped event and must
+                # never be left hanging on a dead loop
                 self.status = self.STOPPED
+                self._stopped_evt.set()
         else:
             raise TranslatorRunError("Run cannot be called without _run_flag")
 
     def stop(self):
-        """ If status is RUNNING, sets the running flag to False """
+        """ If status is RUNNING, sets the running flag to False and
+            blocks on the stopped event until _run acknowledges - the
+            thread idles in the kernel instead of waking every
+            millisecond to re-check the status """
+        if self.status == self.RUNNING:
+            self._run_flag = False
+            self._stopped_evt.wait()
+        else:
+            raise TranslatorStopError("Stop cannot be called when not RUNNING")
+
+
+class AsyncTranslator(Translator):
+    """ Translator implementation driven by an asyncio event loop.
+
+        Each registered operation gets its own pump task instead of a
+        slot in one polling loop. With asyncio.Queue endpoints the event
+        loop parks until a queue actually holds data - no core pegged at
+        100% spinning over empty queues - and one queue going idle never
+        stalls the other operations. MessageQueue-style endpoints are
+        still accepted and polled with a short sleep, so both kinds can
+        be mixed during a migration """
+
+    def _check_endpoints(self, input, output):
+        """ Accepts asyncio.Queue endpoints - exposing get/put - next to
+            the MessageQueue-style ones the base class requires """
+        if not hasattr(input, 'get'):
+            self._check_interface(input, attr="get_message")
+        if not hasattr(output, 'put'):
+            self._check_interface(output, attr="add_message")
+
+    def start(self):
+        """ Runs the pump tasks inside their own event loop. Blocks the
+            calling thread until stop clears the run flag """
+        if self.status in (self.CREATED, self.STOPPED):
+            self._run_flag = True
+            self._stopped_evt.clear()
+            asyncio.run(self._run_async())
+        else:
+            raise TranslatorStartError("Start must be called from CREATED or "
+                                       "STOPPED status!")
+
+    async def _run_async(self):
+        self.status = self.RUNNING
+        pumps = [self._pump(src, dest, operation)
+                 for src, dest, operation in self.operations.values()]
+        try:
+            await asyncio.gather(*pumps)
+        finally:
+            self.status = self.STOPPED
+            self._stopped_evt.set()
+
+    async def _pump(self, src, dest, operation):
+        """ Moves messages from src through the operation into dest until
+            the run flag is cleared.
+
+            asyncio.Queue sources are awaited with a timeout so the flag
+            is still rechecked periodically; plain message-queue sources
+            are polled with a sleep when empty """
+        src_get = getattr(src, 'get', None)
+        dest_put = getattr(dest, 'put', None)
+        get_message = getattr(src, 'get_message', None)
+        if getattr(operation, 'batch_aware', False):
+            # Batch-aware operations consume a whole list - the pump
+            # moves one message at a time, so wrap and unwrap
+            fn = operation
+            operation = lambda message: fn([message])[0]
+        busy = 0
+        while self._run_flag:
+            if src_get is not None:
+                try:
+                    message = await asyncio.wait_for(src_get(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    continue
+            else:
+                message = get_message()
+                if message is None:
+                    busy = 0
+                    await asyncio.sleep(0.001)
+                    continue
+                busy += 1
+                if busy >= 64:
+                    # A sync source never awaits on its own - yield
+                    # periodically so one busy operation cannot starve
+                    # every other pump task on the loop
+                    busy = 0
+                    await asyncio.sleep(0)
+            try:
+                message = operation(message)
+            except MessageError as e:
+                continue # TODO - log here
+            if dest_put is not None:
+                await dest_put(message)
+            else:
+                dest.add_message(message)
+
+    def stop(self):
+        """ Clears the run flag and blocks on the stopped event until the
+            pump tasks notice within their timeout and the event loop in
+            start winds down - same contract as the base stop, so a
+            stop-then-start sequence sees the STOPPED status it expects """
         if self.status == self.RUNNING:
             self._run_flag = False
-            while not self.status == self.STOPPED:
-                time.sleep(0.001)
+            self._stopped_evt.wait()
         else:
             raise TranslatorStopError("Stop cannot be called when not RUNNING")
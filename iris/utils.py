@@ -5,29 +5,56 @@
     is_valid_address(host, port)
 """
 
+import functools
 import ipaddress
 import socket
 
 
-def is_valid_address(host, port):
-    """ Responsible for checking whether the given host port pair is valid.
+# Hosts that show up constantly in practice - answered with a single
+# set lookup before even the ip parser runs
+_WELL_KNOWN_HOSTS = frozenset(('localhost', '127.0.0.1', '0.0.0.0'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve(host):
+    """ Responsible for checking whether the given host is valid.
 
         Host can be given either as an ip address string or hostname.
-        Uses `socket.gethostbyname()` to check whether a hostname exists.
-        Else tries to create the `ipaddress.ip_address` our of a string.
+        The checks run cheapest-first: the well-known literals cost one
+        set lookup, `ipaddress.ip_address` parses an IP literal in pure
+        Python with no syscall - and IP literals are what socket peer
+        addresses actually are - and only genuine hostnames fall through
+        to `socket.gethostbyname()` and its resolver round trip.
+
+        The result is cached - gethostbyname can block on real DNS, and
+        Message construction validates the host on every message.
+        Repeated validation of the same host is a dict lookup.
 
         Returns True or False """
-    if not 0 < port < 65535:
-        return False
+    if host in _WELL_KNOWN_HOSTS:
+        return True
     try:
-        socket.gethostbyname(host)
-    except socket.gaierror:
+        ipaddress.ip_address(host)
+    except ValueError:
         pass
     else:
         return True
     try:
-        ipaddress.ip_address(host)
-    except ValueError:
+        socket.gethostbyname(host)
+    except socket.gaierror:
         return False
     else:
         return True
+
+
+def is_valid_address(host, port):
+    """ Responsible for checking whether the given host port pair is valid.
+
+        The port range check stays inline - it is trivial, and keeping it
+        out of the cache key keeps one cache entry per host instead of
+        one per host/port pair.
+
+        Returns True or False """
+    if not 0 < port < 65535:
+        return False
+    return _resolve(host)